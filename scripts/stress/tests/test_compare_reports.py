@@ -1,11 +1,22 @@
 """Tests for compare_reports.py — #119 Report Diffing Script."""
 
 import json
-import tempfile
+import sys
+from collections import namedtuple
 from pathlib import Path
 
 import pytest
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_COMPARE_SCRIPT = str((Path(__file__).parent.parent / "compare_reports.py").resolve())
+
+_Result = namedtuple("_Result", "file classification verdict attempts")
+_Attempt = namedtuple("_Attempt", "passed stage reason error")
+
 
 def _make_report(detailed_results, pass_list=None, fail_list=None):
     """Build a minimal stress-test report dict."""
@@ -17,24 +28,33 @@ def _make_report(detailed_results, pass_list=None, fail_list=None):
         },
         "pass": pass_list or [],
         "fail": fail_list or [],
-        "detailed_results": detailed_results,
+        "detailed_results": [_to_dict(r) for r in detailed_results],
     }
 
 
 def _make_result(file_name, classification):
-    """Create a single detailed_result entry."""
+    """Create a single detailed_result record."""
+    passed = "pass" in classification
+    return _Result(
+        file=f"{file_name}.json",
+        classification=classification,
+        verdict="solid_pass" if passed else "solid_fail",
+        attempts=(
+            _Attempt(
+                passed=passed,
+                stage=None if passed else "openai",
+                reason=None if passed else "api_error",
+                error="",
+            ),
+        ),
+    )
+
+
+def _to_dict(result):
+    """Serialize a result record to the detailed_results entry shape."""
     return {
-        "file": f"{file_name}.json",
-        "classification": classification,
-        "verdict": "solid_pass" if "pass" in classification else "solid_fail",
-        "attempts": [
-            {
-                "passed": "pass" in classification,
-                "stage": None if "pass" in classification else "openai",
-                "reason": None if "pass" in classification else "api_error",
-                "error": "",
-            }
-        ],
+        **result._asdict(),
+        "attempts": [attempt._asdict() for attempt in result.attempts],
     }
 
 
@@ -42,38 +62,70 @@ def _write_report(tmp_dir, name, detailed_results):
     """Write a report JSON to a temp file and return its path."""
     report = _make_report(detailed_results)
     path = tmp_dir / f"{name}.json"
-    path.write_text(json.dumps(report, indent=2))
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(report))
+    else:
+        path.write_text(json.dumps(report, separators=(",", ":")))
     return str(path)
 
 
-def _load_compare_module():
-    """Load compare_reports.py as a module."""
+@pytest.fixture(scope="session")
+def compare_mod():
+    """Load compare_reports.py as a module, once per session."""
     import importlib.util
 
-    script = Path(__file__).parent.parent / "compare_reports.py"
-    spec = importlib.util.spec_from_file_location("compare_reports", script)
+    if "compare_reports" in sys.modules:
+        return sys.modules["compare_reports"]
+    spec = importlib.util.spec_from_file_location("compare_reports", _COMPARE_SCRIPT)
     mod = importlib.util.module_from_spec(spec)
+    sys.modules["compare_reports"] = mod
     spec.loader.exec_module(mod)
     return mod
 
 
+@pytest.fixture(scope="class")
+def solid_pass_a():
+    """Shared solid_pass entry for schema_a (compare_reports never mutates it)."""
+    return _make_result("schema_a", "solid_pass")
+
+
+@pytest.fixture(scope="class")
+def solid_fail_a():
+    """Shared solid_fail entry for schema_a."""
+    return _make_result("schema_a", "solid_fail")
+
+
+# (baseline_cls, current_cls) pairs that tests read back from disk.
+_DISK_PAIRS = [("solid_pass", "solid_fail")]
+
+
+@pytest.fixture(scope="session")
+def report_paths(tmp_path_factory):
+    """Write every on-disk baseline/current pair once, keyed by classification."""
+    tmp_dir = tmp_path_factory.mktemp("reports")
+    paths = {}
+    for baseline_cls, current_cls in _DISK_PAIRS:
+        stem = f"{baseline_cls}__{current_cls}"
+        paths[(baseline_cls, current_cls)] = (
+            _write_report(
+                tmp_dir, f"{stem}.baseline", [_make_result("schema_a", baseline_cls)]
+            ),
+            _write_report(
+                tmp_dir, f"{stem}.current", [_make_result("schema_a", current_cls)]
+            ),
+        )
+    return paths
+
+
 class TestCompareReports:
     """#119: Report diffing for regression tracking."""
 
-    def test_identical_reports(self):
+    def test_identical_reports(self, compare_mod, solid_pass_a):
         """Two identical reports should show no changes."""
-        mod = _load_compare_module()
-        results = [
-            _make_result("schema_a", "solid_pass"),
-            _make_result("schema_b", "solid_fail"),
-        ]
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            baseline = _write_report(tmp_path, "baseline", results)
-            current = _write_report(tmp_path, "current", results)
-            result = mod.compare_reports(
-                mod.load_report(baseline), mod.load_report(current)
-            )
+        results = [solid_pass_a, _make_result("schema_b", "solid_fail")]
+        baseline = _make_report(results)
+        current = _make_report(results)
+        result = compare_mod.compare_reports(baseline, current)
 
         assert len(result.new_passes) == 0
         assert len(result.new_failures) == 0
@@ -82,84 +134,26 @@ class TestCompareReports:
         assert len(result.config_drift) == 0
         assert len(result.unchanged) == 2
 
-    def test_new_passes_detected(self):
-        """Schema going from solid_fail → solid_pass (not in expected_failures)."""
-        mod = _load_compare_module()
-        baseline_results = [_make_result("schema_a", "solid_fail")]
-        current_results = [_make_result("schema_a", "solid_pass")]
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            baseline = _write_report(tmp_path, "baseline", baseline_results)
-            current = _write_report(tmp_path, "current", current_results)
-            result = mod.compare_reports(
-                mod.load_report(baseline), mod.load_report(current)
-            )
-
-        assert "schema_a" in result.new_passes
-
-    def test_new_failures_detected(self):
-        """Schema going from solid_pass → solid_fail."""
-        mod = _load_compare_module()
-        baseline_results = [_make_result("schema_a", "solid_pass")]
-        current_results = [_make_result("schema_a", "solid_fail")]
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            baseline = _write_report(tmp_path, "baseline", baseline_results)
-            current = _write_report(tmp_path, "current", current_results)
-            result = mod.compare_reports(
-                mod.load_report(baseline), mod.load_report(current)
-            )
-
-        assert "schema_a" in result.new_failures
-
-    def test_flaky_changes_detected(self):
-        """solid_pass → flaky_pass categorized as new_flaky."""
-        mod = _load_compare_module()
-        baseline_results = [_make_result("schema_a", "solid_pass")]
-        current_results = [_make_result("schema_a", "flaky_pass")]
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            baseline = _write_report(tmp_path, "baseline", baseline_results)
-            current = _write_report(tmp_path, "current", current_results)
-            result = mod.compare_reports(
-                mod.load_report(baseline), mod.load_report(current)
-            )
-
-        assert "schema_a" in result.new_flaky
-
-    def test_fixes_detected(self):
-        """expected_fail → solid_pass categorized as fix."""
-        mod = _load_compare_module()
-        baseline_results = [_make_result("schema_a", "expected_fail")]
-        current_results = [_make_result("schema_a", "solid_pass")]
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            baseline = _write_report(tmp_path, "baseline", baseline_results)
-            current = _write_report(tmp_path, "current", current_results)
-            result = mod.compare_reports(
-                mod.load_report(baseline), mod.load_report(current)
-            )
-
-        assert "schema_a" in result.fixes
-
-    def test_config_drift_detected(self):
-        """unexpected_pass → solid_pass categorized as config_drift."""
-        mod = _load_compare_module()
-        baseline_results = [_make_result("schema_a", "unexpected_pass")]
-        current_results = [_make_result("schema_a", "solid_pass")]
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            baseline = _write_report(tmp_path, "baseline", baseline_results)
-            current = _write_report(tmp_path, "current", current_results)
-            result = mod.compare_reports(
-                mod.load_report(baseline), mod.load_report(current)
-            )
-
-        assert "schema_a" in result.config_drift
-
-    def test_schemas_added_removed(self):
+    @pytest.mark.parametrize(
+        "baseline_cls,current_cls,attr",
+        [
+            ("solid_fail", "solid_pass", "new_passes"),
+            ("solid_pass", "solid_fail", "new_failures"),
+            ("solid_pass", "flaky_pass", "new_flaky"),
+            ("expected_fail", "solid_pass", "fixes"),
+            ("unexpected_pass", "solid_pass", "config_drift"),
+        ],
+    )
+    def test_transition_detected(self, compare_mod, baseline_cls, current_cls, attr):
+        """Each classification transition lands in its matching category."""
+        baseline = _make_report([_make_result("schema_a", baseline_cls)])
+        current = _make_report([_make_result("schema_a", current_cls)])
+        result = compare_mod.compare_reports(baseline, current)
+
+        assert "schema_a" in getattr(result, attr)
+
+    def test_schemas_added_removed(self, compare_mod):
         """Different schema sets tracked as baseline_only / current_only."""
-        mod = _load_compare_module()
         baseline_results = [
             _make_result("only_in_baseline", "solid_pass"),
             _make_result("common", "solid_pass"),
@@ -168,20 +162,15 @@ class TestCompareReports:
             _make_result("common", "solid_pass"),
             _make_result("only_in_current", "solid_pass"),
         ]
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            baseline = _write_report(tmp_path, "baseline", baseline_results)
-            current = _write_report(tmp_path, "current", current_results)
-            result = mod.compare_reports(
-                mod.load_report(baseline), mod.load_report(current)
-            )
+        baseline = _make_report(baseline_results)
+        current = _make_report(current_results)
+        result = compare_mod.compare_reports(baseline, current)
 
         assert "only_in_baseline" in result.baseline_only
         assert "only_in_current" in result.current_only
 
-    def test_pass_rate_calculation(self):
+    def test_pass_rate_calculation(self, compare_mod):
         """Pass rates computed correctly."""
-        mod = _load_compare_module()
         baseline_results = [
             _make_result("a", "solid_pass"),
             _make_result("b", "solid_fail"),
@@ -190,87 +179,55 @@ class TestCompareReports:
             _make_result("a", "solid_pass"),
             _make_result("b", "solid_pass"),
         ]
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            baseline = _write_report(tmp_path, "baseline", baseline_results)
-            current = _write_report(tmp_path, "current", current_results)
-            result = mod.compare_reports(
-                mod.load_report(baseline), mod.load_report(current)
-            )
+        baseline = _make_report(baseline_results)
+        current = _make_report(current_results)
+        result = compare_mod.compare_reports(baseline, current)
 
         assert result.baseline_pass_rate == pytest.approx(50.0)
         assert result.current_pass_rate == pytest.approx(100.0)
 
-    def test_exit_code_zero_no_regressions(self):
-        """No new failures → exit 0."""
-        mod = _load_compare_module()
-        baseline_results = [_make_result("a", "solid_pass")]
-        current_results = [_make_result("a", "solid_pass")]
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            baseline = _write_report(tmp_path, "baseline", baseline_results)
-            current = _write_report(tmp_path, "current", current_results)
-            exit_code = mod.get_exit_code(
-                mod.compare_reports(
-                    mod.load_report(baseline), mod.load_report(current)
-                ),
-                strict=False,
-            )
-        assert exit_code == 0
-
-    def test_exit_code_one_with_regressions(self):
-        """New failures → exit 1."""
-        mod = _load_compare_module()
-        baseline_results = [_make_result("a", "solid_pass")]
-        current_results = [_make_result("a", "solid_fail")]
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            baseline = _write_report(tmp_path, "baseline", baseline_results)
-            current = _write_report(tmp_path, "current", current_results)
-            exit_code = mod.get_exit_code(
-                mod.compare_reports(
-                    mod.load_report(baseline), mod.load_report(current)
-                ),
-                strict=False,
-            )
-        assert exit_code == 1
-
-    def test_strict_mode_exits_on_flakiness(self):
-        """--strict + new flaky → exit 1."""
-        mod = _load_compare_module()
-        baseline_results = [_make_result("a", "solid_pass")]
-        current_results = [_make_result("a", "flaky_pass")]
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            baseline = _write_report(tmp_path, "baseline", baseline_results)
-            current = _write_report(tmp_path, "current", current_results)
-            exit_code = mod.get_exit_code(
-                mod.compare_reports(
-                    mod.load_report(baseline), mod.load_report(current)
-                ),
-                strict=True,
-            )
-        assert exit_code == 1
-
-    def test_json_output_flag(self):
+    @pytest.mark.parametrize(
+        "baseline_cls,current_cls,strict,expected",
+        [
+            ("solid_pass", "solid_pass", False, 0),
+            ("solid_pass", "solid_fail", False, 1),
+            ("solid_pass", "flaky_pass", True, 1),
+        ],
+        ids=["no_regressions", "with_regressions", "strict_flakiness"],
+    )
+    def test_exit_code(self, compare_mod, baseline_cls, current_cls, strict, expected):
+        """New failures → exit 1; --strict + new flaky → exit 1; else exit 0."""
+        baseline = _make_report([_make_result("a", baseline_cls)])
+        current = _make_report([_make_result("a", current_cls)])
+        exit_code = compare_mod.get_exit_code(
+            compare_mod.compare_reports(baseline, current),
+            strict=strict,
+        )
+        assert exit_code == expected
+
+    def test_json_output_flag(self, compare_mod, solid_pass_a, solid_fail_a):
         """--json produces valid JSON output."""
-        mod = _load_compare_module()
-        baseline_results = [_make_result("a", "solid_pass")]
-        current_results = [_make_result("a", "solid_fail")]
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            baseline = _write_report(tmp_path, "baseline", baseline_results)
-            current = _write_report(tmp_path, "current", current_results)
-            result = mod.compare_reports(
-                mod.load_report(baseline), mod.load_report(current)
-            )
-            output = mod.format_comparison(result, json_output=True)
+        baseline = _make_report([solid_pass_a])
+        current = _make_report([solid_fail_a])
+        result = compare_mod.compare_reports(baseline, current)
+        output = compare_mod.format_comparison(result, json_output=True)
         parsed = json.loads(output)
         assert "new_failures" in parsed
         assert isinstance(parsed["new_failures"], list)
 
-    def test_missing_file_error(self):
+    def test_load_report_roundtrip(
+        self, compare_mod, report_paths, solid_pass_a, solid_fail_a
+    ):
+        """Reports written to disk load back unchanged."""
+        baseline_path, current_path = report_paths[("solid_pass", "solid_fail")]
+        baseline = compare_mod.load_report(baseline_path)
+        current = compare_mod.load_report(current_path)
+
+        assert baseline == _make_report([solid_pass_a])
+        assert current == _make_report([solid_fail_a])
+        assert "schema_a" in compare_mod.compare_reports(baseline, current).new_failures
+
+    def test_missing_file_error(self, compare_mod):
         """Graceful error on missing report file."""
-        mod = _load_compare_module()
         with pytest.raises((FileNotFoundError, SystemExit)):
-            mod.load_report("/nonexistent/path/report.json")
+            compare_mod.load_report("/nonexistent/path/report.json")